@@ -688,15 +688,16 @@ class Item(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
 
         """
         # Return immediately if no external reference
-        if not self.ref:
+        ref = self.ref
+        if not ref:
             log.debug("no external reference to search for")
             return None, None
         # Update the cache
         if not settings.CACHE_PATHS:
             pyficache.clear_file_cache()
         # Search for the external reference
-        log.debug("seraching for ref '{}'...".format(self.ref))
-        pattern = r"(\b|\W){}(\b|\W)".format(re.escape(self.ref))
+        log.debug("seraching for ref '{}'...".format(ref))
+        pattern = r"(\b|\W){}(\b|\W)".format(re.escape(ref))
         log.trace("regex: {}".format(pattern))
         regex = re.compile(pattern)
         for path, filename, relpath in self.tree.vcs.paths:
@@ -704,7 +705,7 @@ class Item(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
             if path == self.path:
                 continue
             # Check for a matching filename
-            if filename == self.ref:
+            if filename == ref:
                 return relpath, None
             # Skip extensions that should not be considered text
             if os.path.splitext(filename)[-1] in settings.SKIP_EXTS:
@@ -715,11 +716,12 @@ class Item(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
                 log.trace("unable to read lines from: {}".format(path))
                 continue
             for lineno, line in enumerate(lines, start=1):
-                if regex.search(line):
+                # cheap substring test skips the regex for most lines
+                if ref in line and regex.search(line):
                     log.debug("found ref: {}".format(relpath))
                     return relpath, lineno
 
-        msg = "external reference not found: {}".format(self.ref)
+        msg = "external reference not found: {}".format(ref)
         raise DoorstopError(msg)
 
     def find_child_links(self, **kwargs):
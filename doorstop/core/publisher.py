@@ -85,7 +85,7 @@ def _index(directory, index=INDEX, extensions=('.html',), tree=None):
     filenames = []
     for filename in os.listdir(directory):
         if filename.endswith(extensions) and filename != INDEX:
-            filenames.append(os.path.join(filename))
+            filenames.append(filename)
 
     # Create the index
     if filenames:
@@ -205,14 +205,18 @@ def _lines_text(obj, indent=8, width=79, **_):
     :return: iterator of lines of text
 
     """
+    child_links = settings.PUBLISH_CHILD_LINKS
+    grandchild_links = settings.PUBLISH_GRANDCHILD_LINKS
+
     for item in iter_items(obj):
 
         level = _format_level(item.level)
+        text = item.text
 
         if item.heading:
 
             # Level and Text
-            yield "{l:<{s}}{t}".format(l=level, s=indent, t=item.text)
+            yield "{l:<{s}}{t}".format(l=level, s=indent, t=text)
 
         else:
 
@@ -220,9 +224,9 @@ def _lines_text(obj, indent=8, width=79, **_):
             yield "{l:<{s}}{u}".format(l=level, s=indent, u=item.uid)
 
             # Text
-            if item.text:
+            if text:
                 yield ""  # break before text
-                for line in item.text.splitlines():
+                for line in text.splitlines():
                     yield from _chunks(line, width, indent)
 
                     if not line:  # pragma: no cover (integration test)
@@ -235,23 +239,25 @@ def _lines_text(obj, indent=8, width=79, **_):
                 yield from _chunks(ref, width, indent)
 
             # Links
-            if item.links:
+            parent_links = item.links
+            if parent_links:
                 yield ""  # break before links
-                if settings.PUBLISH_CHILD_LINKS:
+                if child_links:
                     label = "Parent links: "
                 else:
                     label = "Links: "
-                slinks = label + ', '.join(str(l) for l in item.links)
+                slinks = label + ', '.join([str(l) for l in parent_links])
                 yield from _chunks(slinks, width, indent)
           
-            if settings.PUBLISH_CHILD_LINKS:
-                if settings.PUBLISH_GRANDCHILD_LINKS:
+            if child_links:
+                if grandchild_links:
                     links = item.find_child_links(grandchildren=True)
                 else:
                     links = item.find_child_links()                  
                 if links:
                     yield ""  # break before links
-                    slinks = "Child links: " + ', '.join(str(l) for l in links)
+                    slinks = ("Child links: " +
+                              ', '.join([str(l) for l in links]))
                     yield from _chunks(slinks, width, indent)
 
         yield ""  # break between items
@@ -273,31 +279,25 @@ def _lines_markdown(obj, linkify=False):
     :return: iterator of lines of text
 
     """
+    child_links = settings.PUBLISH_CHILD_LINKS
+    grandchild_links = settings.PUBLISH_GRANDCHILD_LINKS
 
     for item in iter_items(obj):
 
         heading = '#' * item.depth
-        level = _format_level(item.level)
+        text = item.text
 
         if item.heading:
 
-            # Level and Text
-            # standard = "{h} {l} {t}".format(h=heading, l=level, t=item.text) # original
-            # remove  level from title
-            standard = "{h} {t}".format(h=heading, t=item.text)
+            # Text (levels are not published in headings)
+            standard = "{h} {t}".format(h=heading, t=text)
             attr_list = _format_md_attr_list(item, linkify)
             yield standard + attr_list
 
         else:
 
-            # Level and UID
-            if settings.PUBLISH_BODY_LEVELS:
-                # Level and Text
-                # standard = "{h} {l} {t}".format(h=heading, l=level, t=item.text) # original
-                # remove  level from title
-                standard = "{h} {u}".format(h=heading, u=item.uid)
-            else:
-                standard = "{h} {u}".format(h=heading, u=item.uid)
+            # UID (levels are not published on non-header items)
+            standard = "{h} {u}".format(h=heading, u=item.uid)
             attr_list = _format_md_attr_list(item, linkify)
             yield standard + attr_list
 
@@ -305,43 +305,46 @@ def _lines_markdown(obj, linkify=False):
                     yield ""  # break before name
                     yield from  ("*"+item._data['short name']+"*").splitlines()
                     yield ""  # break after name
-# Text
-            if item.text:
+
+            # Text
+            if text:
                 yield ""  # break before text
-                yield from item.text.splitlines()
+                yield from text.splitlines()
 
             # Reference
             if item.ref:
                 yield ""  # break before reference
                 yield _format_md_ref(item)
 
-            if 'owner(s)' in item._data.keys():
-                if item._data['owner(s)']:
-                    if settings.PUBLISH_CHILD_LINKS:
-                        yield ""  # break before reference
-                        yield "*Owner(s):*"  # break before text
-                        yield from item._data['owner(s)'].splitlines()
-            if item._data['rationale']:
-                if settings.PUBLISH_CHILD_LINKS:
+            owners = item._data.get('owner(s)')
+            if owners:
+                if child_links:
+                    yield ""  # break before reference
+                    yield "*Owner(s):*"  # break before text
+                    yield from owners.splitlines()
+            rationale = item._data['rationale']
+            if rationale:
+                if child_links:
                     yield ""  # break before reference
                     yield "*Rationale:*"  # break before text
-                    yield from item._data['rationale'].splitlines()
-            if item._data['verification plan']:
-                if settings.PUBLISH_CHILD_LINKS:
+                    yield from rationale.splitlines()
+            plan = item._data['verification plan']
+            if plan:
+                if child_links:
                     yield ""  # break before reference
                     yield "*Verification plan:*"  # break before text
-                    yield from item._data['verification plan'].splitlines()
-            if 'notes' in item._data.keys():
-                if item._data['notes']:
-                    if settings.PUBLISH_CHILD_LINKS:
-                        yield ""  # break before reference
-                        yield "*Notes:*"  # break before text
-                        yield from item._data['notes'].splitlines()
+                    yield from plan.splitlines()
+            notes = item._data.get('notes')
+            if notes:
+                if child_links:
+                    yield ""  # break before reference
+                    yield "*Notes:*"  # break before text
+                    yield from notes.splitlines()
             # Parent links
             if item.links:
                 yield ""  # break before links
                 items2 = item.parent_items
-                if settings.PUBLISH_CHILD_LINKS:
+                if child_links:
                     label = "Parent links:"
                 else:
                     label = "Links:"
@@ -350,8 +353,8 @@ def _lines_markdown(obj, linkify=False):
                 yield label_links
 
             # Child links
-            if settings.PUBLISH_CHILD_LINKS:
-                if settings.PUBLISH_GRANDCHILD_LINKS:
+            if child_links:
+                if grandchild_links:
                     items2 = item.find_child_items(grandchildren=True)
                 else:
                     items2 = item.find_child_items()
@@ -488,7 +491,7 @@ def check(ext):
     :return: lines generator if available
 
     """
-    exts = ', '.join(ext for ext in FORMAT_LINES)
+    exts = ', '.join(FORMAT_LINES)
     msg = "unknown publish format: {} (options: {})".format(ext or None, exts)
     exc = DoorstopError(msg)
 
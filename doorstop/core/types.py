@@ -192,6 +192,8 @@ class UID(object):
         if self._exc:
             raise self._exc
 
+    RE_UID = re.compile(r"([\w.-]*\D)(\d+)")
+
     @staticmethod
     def split_uid(text):
         """Split an item's UID string into a prefix and number.
@@ -206,7 +208,7 @@ class UID(object):
         ('REQ2', 1)
 
         """
-        match = re.match(r"([\w.-]*\D)(\d+)", text)
+        match = UID.RE_UID.match(text)
         if not match:
             raise ValueError("unable to parse UID: {}".format(text))
         prefix = match.group(1).rstrip(settings.SEP_CHARS)